@@ -1,5 +1,6 @@
 use repx_core::model::{Job, JobId, Lab, StageType};
 use serde_json::Value;
+use std::borrow::Cow;
 use std::collections::{BTreeMap, BTreeSet, HashMap, HashSet};
 
 use crate::helpers::*;
@@ -59,6 +60,17 @@ fn write_sg_edge(
     dot.push_str("    ];\n");
 }
 
+type VaryingParams = BTreeMap<String, Vec<Value>>;
+
+const MISSING_MARKER: &str = "?";
+
+#[derive(Default)]
+struct KeyValues<'v> {
+    values: HashSet<Cow<'v, str>>,
+    present: usize,
+    has_values: bool,
+}
+
 pub(crate) struct VizGenerator<'a> {
     pub lab: &'a Lab,
     scatter_gather_clean_names: HashSet<String>,
@@ -666,52 +678,137 @@ impl<'a> VizGenerator<'a> {
         }
     }
 
-    fn get_varying_params(&self, job_ids: &[&JobId]) -> BTreeMap<String, Vec<Value>> {
+    fn get_varying_params(&self, job_ids: &[&JobId]) -> VaryingParams {
         if job_ids.is_empty() {
             return BTreeMap::new();
         }
 
-        let mut all_keys = HashSet::new();
+        let mut per_key: HashMap<&str, KeyValues> = HashMap::new();
         for jid in job_ids {
-            if let Some(job) = self.lab.jobs.get(jid) {
-                if let Value::Object(params) = &job.params {
-                    for k in params.keys() {
-                        all_keys.insert(k.clone());
-                    }
+            let Some(Value::Object(params)) = self.lab.jobs.get(jid).map(|job| &job.params) else {
+                continue;
+            };
+            for (key, val) in params {
+                let entry = per_key.entry(key.as_str()).or_default();
+                let s_val = canonical_json(val);
+                if !matches!(val, Value::String(s) if s == MISSING_MARKER) {
+                    entry.has_values = true;
                 }
+                entry.values.insert(s_val);
+                entry.present += 1;
             }
         }
 
         let mut varying = BTreeMap::new();
-        let missing_marker = Value::String("?".to_string());
-
-        for key in all_keys {
-            let mut values = HashSet::new();
-            let mut has_values = false;
-
-            for jid in job_ids {
-                let val = self
-                    .lab
-                    .jobs
-                    .get(jid)
-                    .and_then(|job| job.params.get(&key))
-                    .unwrap_or(&missing_marker);
-
-                let s_val = canonical_json(val);
-                values.insert(s_val);
-                if val != &missing_marker {
-                    has_values = true;
-                }
+        for (key, mut entry) in per_key {
+            if entry.present < job_ids.len() {
+                entry.values.insert(Cow::Borrowed(MISSING_MARKER));
             }
 
-            if has_values && values.len() > 1 {
-                let mut clean_values: Vec<String> =
-                    values.into_iter().filter(|v| v != "?").collect();
+            if entry.has_values && entry.values.len() > 1 {
+                let mut clean_values: Vec<String> = entry
+                    .values
+                    .into_iter()
+                    .filter(|v| v != MISSING_MARKER)
+                    .map(Cow::into_owned)
+                    .collect();
                 clean_values.sort();
 
-                varying.insert(key, clean_values.into_iter().map(Value::String).collect());
+                varying.insert(
+                    key.to_string(),
+                    clean_values.into_iter().map(Value::String).collect(),
+                );
             }
         }
         varying
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::json;
+
+    fn lab_with_params(params: &[(&str, Value)]) -> Lab {
+        let jobs: serde_json::Map<String, Value> = params
+            .iter()
+            .map(|(id, p)| ((*id).to_string(), json!({ "name": "stage", "params": p })))
+            .collect();
+        serde_json::from_value(json!({
+            "repx_version": "test",
+            "lab_version": "test",
+            "gitHash": "test",
+            "runs": {},
+            "jobs": jobs,
+        }))
+        .expect("test lab should deserialize")
+    }
+
+    fn varying(params: &[(&str, Value)]) -> VaryingParams {
+        let lab = lab_with_params(params);
+        let job_ids: Vec<JobId> = params.iter().map(|(id, _)| JobId::from(*id)).collect();
+        let job_refs: Vec<&JobId> = job_ids.iter().collect();
+        VizGenerator::new(&lab).get_varying_params(&job_refs)
+    }
+
+    fn strings(values: &[&str]) -> Vec<Value> {
+        values
+            .iter()
+            .map(|v| Value::String((*v).to_string()))
+            .collect()
+    }
+
+    #[test]
+    fn test_varying_params_identical_values() {
+        let result = varying(&[("j1", json!({"a": 1})), ("j2", json!({"a": 1}))]);
+        assert!(result.is_empty());
+    }
+
+    #[test]
+    fn test_varying_params_key_missing_from_some_jobs() {
+        let result = varying(&[("j1", json!({"a": 1, "b": 1})), ("j2", json!({"a": 2}))]);
+        assert_eq!(result.get("a"), Some(&strings(&["1", "2"])));
+        assert_eq!(result.get("b"), Some(&strings(&["1"])));
+    }
+
+    #[test]
+    fn test_varying_params_literal_missing_marker() {
+        let result = varying(&[("j1", json!({"k": "?"})), ("j2", json!({"k": "?"}))]);
+        assert!(result.is_empty());
+
+        let result = varying(&[("j1", json!({"k": "?"})), ("j2", json!({"k": "v"}))]);
+        assert_eq!(result.get("k"), Some(&strings(&["v"])));
+
+        let result = varying(&[("j1", json!({"k": "?"})), ("j2", json!({}))]);
+        assert!(result.is_empty());
+    }
+
+    #[test]
+    fn test_varying_params_non_object_params() {
+        let result = varying(&[("j1", Value::Null), ("j2", json!({"a": 1}))]);
+        assert_eq!(result.get("a"), Some(&strings(&["1"])));
+
+        let result = varying(&[("j1", json!([1, 2])), ("j2", Value::Null)]);
+        assert!(result.is_empty());
+    }
+
+    #[test]
+    fn test_varying_params_list_and_object_values() {
+        let result = varying(&[
+            ("j1", json!({"l": [1, 2], "o": {"x": 1}})),
+            ("j2", json!({"l": [1, 2], "o": {"x": 2}})),
+            ("j3", json!({"l": [3], "o": {"x": 1}})),
+        ]);
+        assert_eq!(result.get("l"), Some(&strings(&["[1,2]", "[3]"])));
+        assert_eq!(result.get("o"), Some(&strings(&["{\"x\":1}", "{\"x\":2}"])));
+    }
+
+    #[test]
+    fn test_varying_params_unknown_job_ids() {
+        let lab = lab_with_params(&[("j1", json!({"a": 1}))]);
+        let known = JobId::from("j1");
+        let unknown = JobId::from("missing");
+        let result = VizGenerator::new(&lab).get_varying_params(&[&known, &unknown]);
+        assert_eq!(result.get("a"), Some(&strings(&["1"])));
+    }
+}
@@ -1,4 +1,5 @@
 use serde_json::Value;
+use std::borrow::Cow;
 
 pub(crate) const DPI: &str = "300";
 pub(crate) const FONT_NAME: &str = "Helvetica, Arial, sans-serif";
@@ -30,19 +31,33 @@ const DEFAULT_FILL: &str = "#F8FAFC";
 
 pub(crate) const RUN_FILL: &str = "#F1F5F9";
 
+const FILL_COLORS: &[(&str, &str)] = &[
+    ("producer", "#EFF6FF"),
+    ("consumer", "#ECFDF5"),
+    ("worker", "#ECFDF5"),
+    ("partial", "#FFFBEB"),
+    ("total", "#FFF1F2"),
+];
+
+fn contains_ignore_ascii_case(haystack: &str, needle: &str) -> bool {
+    haystack
+        .as_bytes()
+        .windows(needle.len())
+        .any(|w| w.eq_ignore_ascii_case(needle.as_bytes()))
+}
+
 pub(crate) fn get_fill_color(name: &str) -> &'static str {
-    let name_lower = name.to_lowercase();
-    if name_lower.contains("producer") {
-        "#EFF6FF"
-    } else if name_lower.contains("consumer") || name_lower.contains("worker") {
-        "#ECFDF5"
-    } else if name_lower.contains("partial") {
-        "#FFFBEB"
-    } else if name_lower.contains("total") {
-        "#FFF1F2"
-    } else {
-        DEFAULT_FILL
+    if !name.is_ascii() {
+        let name_lower = name.to_lowercase();
+        return FILL_COLORS
+            .iter()
+            .find(|(kind, _)| name_lower.contains(kind))
+            .map_or(DEFAULT_FILL, |(_, color)| color);
     }
+    FILL_COLORS
+        .iter()
+        .find(|(kind, _)| contains_ignore_ascii_case(name, kind))
+        .map_or(DEFAULT_FILL, |(_, color)| color)
 }
 
 pub(crate) fn escape_dot_label(s: &str) -> String {
@@ -54,34 +69,51 @@ pub(crate) fn escape_dot_label(s: &str) -> String {
         .replace('}', "\\}")
 }
 
+fn is_id_byte(b: u8) -> bool {
+    b.is_ascii_alphanumeric() || b == b'_'
+}
+
 pub(crate) fn clean_id(s: &str) -> String {
-    s.chars()
-        .filter(|c| c.is_ascii_alphanumeric() || *c == '_')
+    // Every kept character is ASCII, so filtering bytes is equivalent to
+    // filtering chars: UTF-8 continuation and lead bytes are never kept.
+    if s.bytes().all(is_id_byte) {
+        return s.to_string();
+    }
+    s.bytes()
+        .filter(|b| is_id_byte(*b))
+        .map(char::from)
         .collect()
 }
 
 #[allow(clippy::expect_used)]
-pub(crate) fn canonical_json(v: &Value) -> String {
+pub(crate) fn canonical_json(v: &Value) -> Cow<'_, str> {
     match v {
-        Value::String(s) => s.clone(),
-        _ => serde_json::to_string(v).expect("serializing JSON value to string should not fail"),
+        Value::String(s) => Cow::Borrowed(s),
+        _ => Cow::Owned(
+            serde_json::to_string(v).expect("serializing JSON value to string should not fail"),
+        ),
     }
 }
 
 #[allow(clippy::expect_used)]
 pub(crate) fn smart_truncate(val: &Value, max_len: usize) -> String {
-    let mut s = match val {
-        Value::String(s) => s.clone(),
-        _ => serde_json::to_string(val).expect("serializing JSON value to string should not fail"),
+    let serialized;
+    let raw: &str = match val {
+        Value::String(s) => s,
+        _ => {
+            serialized = serde_json::to_string(val)
+                .expect("serializing JSON value to string should not fail");
+            &serialized
+        }
     };
 
-    if s.contains('/') {
-        if let Some(filename) = s.split('/').next_back() {
-            s = filename.to_string();
-        }
+    // Byte length bounds the char count, so short plain labels need no further work.
+    if raw.len() <= max_len && !raw.contains(['/', '[', ']', '\'', '"']) {
+        return raw.to_string();
     }
 
-    s = s.replace(['[', ']', '\'', '"'], "");
+    let filename = raw.rsplit_once('/').map_or(raw, |(_, filename)| filename);
+    let s = filename.replace(['[', ']', '\'', '"'], "");
 
     let char_count = s.chars().count();
     if char_count > max_len {
@@ -108,6 +140,8 @@ mod tests {
         assert_eq!(get_fill_color("STAGE-PRODUCER"), "#EFF6FF");
         assert_eq!(get_fill_color("Stage-Consumer"), "#ECFDF5");
         assert_eq!(get_fill_color(""), DEFAULT_FILL);
+        assert_eq!(get_fill_color("total-of-producers"), "#EFF6FF");
+        assert_eq!(get_fill_color("étape-Worker"), "#ECFDF5");
     }
 
     #[test]
@@ -118,6 +152,7 @@ mod tests {
         assert_eq!(clean_id(""), "");
         assert_eq!(clean_id("@#$%^&*"), "");
         assert_eq!(clean_id("name"), "name");
+        assert_eq!(clean_id("stäge-ü_1"), "stge_1");
     }
 
     #[test]
@@ -148,6 +183,12 @@ mod tests {
         let exact = Value::String("x".repeat(10));
         assert_eq!(smart_truncate(&exact, 10), "xxxxxxxxxx");
 
+        let dir = Value::String("a/".to_string());
+        assert_eq!(smart_truncate(&dir, 30), "");
+
+        let array = serde_json::json!(["x"]);
+        assert_eq!(smart_truncate(&array, 30), "x");
+
         let boundary = Value::String("a".repeat(11));
         let res = smart_truncate(&boundary, 10);
         assert!(res.len() <= 10);
@@ -1,20 +1,27 @@
+import importlib as _importlib
 import logging
-from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any as _Any
 
-try:
-    __version__ = version("repx-py")
-except PackageNotFoundError:
-    __version__ = "unknown"
+if _TYPE_CHECKING:
+    from .models import (
+        ArtifactResolver,
+        Experiment,
+        JobCollection,
+        JobView,
+        LocalCacheResolver,
+        ManifestResolver,
+    )
 
-
-from .models import (
-    ArtifactResolver,
-    Experiment,
-    JobCollection,
-    JobView,
-    LocalCacheResolver,
-    ManifestResolver,
-)
+_LAZY_ATTRS = {
+    "ArtifactResolver": "models",
+    "Experiment": "models",
+    "JobCollection": "models",
+    "JobView": "models",
+    "LocalCacheResolver": "models",
+    "ManifestResolver": "models",
+}
+_LAZY_SUBMODULES = frozenset(_LAZY_ATTRS.values())
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
@@ -27,3 +34,36 @@ __all__ = [
     "ManifestResolver",
     "__version__",
 ]
+
+
+def _read_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("repx-py")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def __getattr__(name: str) -> _Any:
+    if name == "__version__":
+        # Resolved on first access: scanning package metadata is a noticeable
+        # part of import time and most callers never look at the version.
+        value = globals()[name] = _read_version()
+        return value
+
+    if name in _LAZY_SUBMODULES:
+        return _importlib.import_module(f".{name}", __name__)
+
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(
+        set(globals()) | set(_LAZY_ATTRS) | _LAZY_SUBMODULES | {"__version__"}
+    )
@@ -2,17 +2,20 @@ from __future__ import annotations
 
 import json
 import logging
+import operator
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Any,
     Literal,
     TypedDict,
     overload,
 )
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -100,10 +103,23 @@ class LocalCacheResolver(ArtifactResolver):
     """
 
     def __init__(self, cache_dir: str | Path = ".repx-cache"):
-        self.cache_dir = Path(cache_dir).resolve()
+        self._job_out_dirs: dict[str, Path] = {}
+        self.cache_dir = Path(cache_dir)
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    @cache_dir.setter
+    def cache_dir(self, cache_dir: str | Path) -> None:
+        self._cache_dir = Path(cache_dir).resolve()
+        self._job_out_dirs.clear()
 
     def resolve_path(self, job: JobView, relative_path: str) -> Path:
-        return self.cache_dir / job.id / "out" / relative_path
+        out_dir = self._job_out_dirs.get(job.id)
+        if out_dir is None:
+            out_dir = self._job_out_dirs[job.id] = self._cache_dir / job.id / "out"
+        return out_dir / relative_path
 
 
 class ManifestResolver(ArtifactResolver):
@@ -116,11 +132,12 @@ class ManifestResolver(ArtifactResolver):
         self.mapping = {k: Path(v) for k, v in job_output_map.items()}
 
     def resolve_path(self, job: JobView, relative_path: str) -> Path:
-        if job.id not in self.mapping:
+        out_dir = self.mapping.get(job.id)
+        if out_dir is None:
             raise FileNotFoundError(
                 f"No output path recorded for job '{job.id}' in the provided manifest."
             )
-        return self.mapping[job.id] / relative_path
+        return out_dir / relative_path
 
 
 class JobView:
@@ -129,6 +146,8 @@ class JobView:
     to locate its physical output artifacts using a Resolver.
     """
 
+    __slots__ = ("__weakref__", "_data", "_exp", "_id")
+
     def __init__(self, job_id: str, experiment: Experiment):
         self._id = job_id
         self._exp = experiment
@@ -209,11 +228,15 @@ class JobView:
         else:
             path = self._exp.resolver.resolve_path(self, output_key_or_filename)
 
+        import pandas as pd
+
         logger.debug(f"Loading CSV for job {self.id} from {path}")
         return pd.read_csv(path, **kwargs)
 
     def __getattr__(self, key: str) -> Any:
-        if key in self._data:
+        # Private and dunder names are never metadata keys; rejecting them up
+        # front also keeps copy/pickle probes from recursing into `_data`.
+        if not key.startswith("_") and key in self._data:
             return self._data[key]
         raise AttributeError(f"'JobView' object has no attribute or data key '{key}'")
 
@@ -221,64 +244,133 @@ class JobView:
         return f"<JobView id={self.id} name={self.name}>"
 
 
+_MISSING = object()
+
+_FILTER_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "startswith": lambda actual, required: str(actual).startswith(required),
+    "endswith": lambda actual, required: str(actual).endswith(required),
+    "contains": lambda actual, required: required in str(actual),
+}
+
+
+def _compile_filter(key: str, required_value: Any) -> Callable[[JobView], bool]:
+    """Turns a single `filter` keyword argument into a predicate over a JobView."""
+    if "__" in key:
+        attr, op = key.split("__", 1)
+        compare = _FILTER_OPERATORS.get(op)
+        if compare is None:
+            logger.warning(f"Unknown filter operator: __{op}")
+            compare = operator.eq
+    else:
+        attr, compare = key, operator.eq
+
+    def predicate(job: JobView) -> bool:
+        actual_value = getattr(job, attr, _MISSING)
+        if actual_value is _MISSING:
+            return False
+        return compare(actual_value, required_value)
+
+    return predicate
+
+
+_NAN = float("nan")
+
+
+def _flatten_nested(params: dict[str, Any], prefix: str) -> Iterator[tuple[str, Any]]:
+    for key, value in params.items():
+        if isinstance(value, dict):
+            yield from _flatten_nested(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+def _flatten_params(params: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+    """
+    Yields (column, value) pairs, flattening nested dicts into dotted keys.
+    Columns come out in the same order as `pd.json_normalize`: top-level plain
+    values first, then each nested dict flattened depth-first in key order.
+    """
+    nested = []
+    for key, value in params.items():
+        if isinstance(value, dict):
+            nested.append((key, value))
+        else:
+            yield key, value
+    for key, value in nested:
+        yield from _flatten_nested(value, f"{key}.")
+
+
 class JobCollection(Sequence[JobView]):
-    def __init__(self, experiment: Experiment, job_ids: Iterable[str]):
+    """
+    An ordered collection of jobs. Filters are accumulated lazily and evaluated
+    together in a single pass over the source job IDs on first access.
+    """
+
+    def __init__(
+        self,
+        experiment: Experiment,
+        job_ids: Iterable[str],
+        _predicates: tuple[Callable[[JobView], bool], ...] = (),
+    ):
         self._exp = experiment
-        self._job_ids = list(job_ids)
+        self._source = list(job_ids)
+        self._predicates = _predicates
+        self._matched_ids: list[str] | None = None if _predicates else self._source
+
+    @property
+    def _job_ids(self) -> list[str]:
+        if self._matched_ids is None:
+            get_job = self._exp.get_job
+            predicates = self._predicates
+            matched = []
+            for job_id in self._source:
+                job = get_job(job_id)
+                if all(p(job) for p in predicates):
+                    matched.append(job_id)
+            self._matched_ids = matched
+        return self._matched_ids
 
     def filter(
         self, predicate: Callable[[JobView], bool] | None = None, **kwargs
     ) -> JobCollection:
-        def match(job: JobView) -> bool:
-            if predicate and not predicate(job):
-                return False
-
-            for key, required_value in kwargs.items():
-                if "__" in key:
-                    attr, op = key.split("__", 1)
-                    if not hasattr(job, attr):
-                        return False
-                    actual_value = getattr(job, attr)
-
-                    if op == "startswith":
-                        if not str(actual_value).startswith(required_value):
-                            return False
-                    elif op == "endswith":
-                        if not str(actual_value).endswith(required_value):
-                            return False
-                    elif op == "contains":
-                        if required_value not in str(actual_value):
-                            return False
-                    else:
-                        logger.warning(f"Unknown filter operator: __{op}")
-                        if actual_value != required_value:
-                            return False
-                else:
-                    if not hasattr(job, key) or getattr(job, key) != required_value:
-                        return False
-
-            return True
-
-        filtered_ids = [
-            job_id
-            for job_id in self._job_ids
-            if (job := self._exp.get_job(job_id)) and match(job)
+        """
+        Returns a new collection restricted by `predicate` and keyword filters.
+        Evaluation is deferred until the result is first used, so errors from
+        predicates or unknown job IDs surface then rather than here.
+        """
+        new_predicates = [
+            _compile_filter(key, required_value)
+            for key, required_value in kwargs.items()
         ]
-        return JobCollection(self._exp, filtered_ids)
+        if predicate:
+            new_predicates.insert(0, predicate)
+
+        if self._matched_ids is not None:
+            return JobCollection(self._exp, self._matched_ids, tuple(new_predicates))
+        return JobCollection(
+            self._exp, self._source, self._predicates + tuple(new_predicates)
+        )
 
     def to_dataframe(self) -> pd.DataFrame:
-        data = []
-        for job_id in self._job_ids:
-            job = self._exp.get_job(job_id)
-            row = {"job_id": job.id, "name": job.name}
-            row.update(job.effective_params)
-            data.append(row)
+        import pandas as pd
 
-        if not data:
+        job_ids = self._job_ids
+        if not job_ids:
             return pd.DataFrame()
 
-        df = pd.json_normalize(data)
-        if "job_id" in df.columns and df["job_id"].is_unique:
+        num_jobs = len(job_ids)
+        columns: dict[str, list[Any]] = {"job_id": list(job_ids), "name": []}
+        for i, job_id in enumerate(job_ids):
+            job = self._exp.get_job(job_id)
+            columns["name"].append(job.name)
+            for key, value in _flatten_params(job.effective_params):
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [_NAN] * num_jobs
+                column[i] = value
+
+        df = pd.DataFrame(columns)
+        if df["job_id"].is_unique:
             df = df.set_index("job_id")
 
         return df
@@ -328,6 +420,7 @@ class Experiment:
             )
 
         self._job_view_cache: dict[str, JobView] = {}
+        self._last_job: tuple[str, JobView] | None = None
         self._effective_params_cache: dict[str, dict[str, Any]] = (
             self._calculate_all_effective_params()
         )
@@ -510,11 +603,17 @@ class Experiment:
         return raw_data
 
     def get_job(self, job_id: str) -> JobView:
-        if job_id not in self._job_view_cache:
+        last = self._last_job
+        if last is not None and last[0] == job_id:
+            return last[1]
+
+        job = self._job_view_cache.get(job_id)
+        if job is None:
             if job_id not in self._metadata.get("jobs", {}):
                 raise KeyError(f"Job ID '{job_id}' not found.")
-            self._job_view_cache[job_id] = JobView(job_id, self)
-        return self._job_view_cache[job_id]
+            job = self._job_view_cache[job_id] = JobView(job_id, self)
+        self._last_job = (job_id, job)
+        return job
 
     def get_run_for_job(self, job_id: str) -> tuple[str, RunMetadata]:
         run_name = self._job_to_run_map.get(job_id)
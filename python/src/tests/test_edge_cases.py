@@ -1,5 +1,6 @@
 """Tests for edge cases and error handling in models."""
 
+from collections import namedtuple
 from pathlib import Path
 
 import pytest
@@ -11,6 +12,32 @@ from repx_py.models import (
     ManifestResolver,
 )
 
+MockJob = namedtuple("MockJob", ["id"])
+
+
+def experiment_from_jobs(jobs: dict) -> Experiment:
+    """Builds an in-memory, single-run Experiment from a jobs dict."""
+    return Experiment(
+        _preloaded_metadata={
+            "root": {},
+            "runs": {"run": {"name": "run", "jobs": jobs}},
+            "jobs": jobs,
+        }
+    )
+
+
+@pytest.fixture
+def synthetic_experiment() -> Experiment:
+    """A small in-memory experiment that does not need the reference lab."""
+    return experiment_from_jobs(
+        {
+            "j1": {"name": "stage-A-producer", "stage_type": "simple", "params": {}},
+            "j2": {"name": "stage-B-producer", "stage_type": "simple", "params": {}},
+            "j3": {"name": "stage-C-consumer", "stage_type": "simple", "params": {}},
+            "j4": {"name": "stage-D-sg", "stage_type": "scatter-gather", "params": {}},
+        }
+    )
+
 
 class TestLocalCacheResolver:
     """Tests for LocalCacheResolver class."""
@@ -18,13 +45,24 @@ class TestLocalCacheResolver:
     def test_resolve_path_structure(self, tmp_path):
         resolver = LocalCacheResolver(tmp_path)
 
-        class MockJob:
-            id = "test-job-123"
-
-        result = resolver.resolve_path(MockJob(), "output.csv")
+        result = resolver.resolve_path(MockJob("test-job-123"), "output.csv")
         expected = tmp_path / "test-job-123" / "out" / "output.csv"
         assert result == expected
 
+    def test_repeated_resolve_matches_chained_join(self, tmp_path):
+        resolver = LocalCacheResolver(tmp_path)
+        for relative_path in ["a.csv", "nested/b.txt", "a.csv"]:
+            for job_id in ["job-1", "job-2", "job-1"]:
+                result = resolver.resolve_path(MockJob(job_id), relative_path)
+                assert result == tmp_path.resolve() / job_id / "out" / relative_path
+
+    def test_cache_dir_reassignment(self, tmp_path):
+        resolver = LocalCacheResolver(tmp_path / "old")
+        resolver.resolve_path(MockJob("job-1"), "a.csv")
+        resolver.cache_dir = tmp_path / "new"
+        result = resolver.resolve_path(MockJob("job-1"), "a.csv")
+        assert result == tmp_path.resolve() / "new" / "job-1" / "out" / "a.csv"
+
     def test_resolve_path_with_string_input(self, tmp_path):
         resolver = LocalCacheResolver(str(tmp_path))
         assert resolver.cache_dir == tmp_path.resolve()
@@ -36,10 +74,7 @@ class TestLocalCacheResolver:
     def test_resolve_nested_path(self, tmp_path):
         resolver = LocalCacheResolver(tmp_path)
 
-        class MockJob:
-            id = "job-456"
-
-        result = resolver.resolve_path(MockJob(), "nested/dir/file.txt")
+        result = resolver.resolve_path(MockJob("job-456"), "nested/dir/file.txt")
         expected = tmp_path / "job-456" / "out" / "nested/dir/file.txt"
         assert result == expected
 
@@ -54,20 +89,14 @@ class TestManifestResolver:
         }
         resolver = ManifestResolver(mapping)
 
-        class MockJob:
-            id = "job-1"
-
-        result = resolver.resolve_path(MockJob(), "data.csv")
+        result = resolver.resolve_path(MockJob("job-1"), "data.csv")
         assert result == Path("/nix/store/abc-result/data.csv")
 
     def test_resolve_path_not_found(self):
         resolver = ManifestResolver({"job-1": "/path"})
 
-        class MockJob:
-            id = "unknown-job"
-
         with pytest.raises(FileNotFoundError, match="No output path recorded"):
-            resolver.resolve_path(MockJob(), "file.txt")
+            resolver.resolve_path(MockJob("unknown-job"), "file.txt")
 
     def test_path_conversion_to_pathlib(self):
         mapping = {"job-1": "/some/string/path"}
@@ -117,6 +146,55 @@ class TestJobCollection:
             assert "producer" in job.name
 
 
+class TestJobCollectionLazyFilter:
+    """Tests for lazily evaluated, chained JobCollection filters."""
+
+    def test_chained_filters_combine(self, synthetic_experiment):
+        jobs = synthetic_experiment.jobs()
+        filtered = jobs.filter(stage_type="simple").filter(name__contains="producer")
+        assert [job.id for job in filtered] == ["j1", "j2"]
+        assert len(jobs) == 4
+
+    def test_filter_after_materialization(self, synthetic_experiment):
+        simple = synthetic_experiment.jobs().filter(stage_type="simple")
+        assert len(simple) == 3
+        producers = simple.filter(lambda j: j.name.endswith("producer"))
+        assert [job.id for job in producers] == ["j1", "j2"]
+
+    def test_generator_source(self, synthetic_experiment):
+        ids = ["j1", "j4"]
+        jobs = JobCollection(synthetic_experiment, (job_id for job_id in ids))
+        filtered = jobs.filter(stage_type="simple")
+        assert len(jobs) == 2
+        assert len(filtered) == 1
+        assert len(jobs.filter(name__startswith="stage-D")) == 1
+
+    def test_predicate_error_surfaces_on_first_access(self, synthetic_experiment):
+        def failing(job):
+            raise RuntimeError(f"bad predicate for {job.id}")
+
+        filtered = synthetic_experiment.jobs().filter(failing)
+        with pytest.raises(RuntimeError, match="bad predicate"):
+            len(filtered)
+        with pytest.raises(RuntimeError, match="bad predicate"):
+            list(filtered)
+
+    def test_unknown_job_id_surfaces_on_first_access(self, synthetic_experiment):
+        filtered = JobCollection(synthetic_experiment, ["j1", "missing"]).filter(
+            stage_type="simple"
+        )
+        with pytest.raises(KeyError, match="not found"):
+            len(filtered)
+
+    def test_source_is_copied(self, synthetic_experiment):
+        ids = ["j1", "j2"]
+        jobs = JobCollection(synthetic_experiment, ids)
+        filtered = jobs.filter(stage_type="simple")
+        ids.append("j3")
+        assert len(jobs) == 2
+        assert len(filtered) == 2
+
+
 class TestJobView:
     """Tests for JobView edge cases."""
 
@@ -140,6 +218,26 @@ class TestJobView:
             job.get_output_path("nonexistent_output_key")
 
 
+class TestJobViewSlots:
+    """Tests for JobView behavior that depends on its __slots__ layout."""
+
+    def test_weakref(self, synthetic_experiment):
+        import weakref
+
+        job = synthetic_experiment.get_job("j1")
+        assert weakref.ref(job)() is job
+
+    def test_copy(self, synthetic_experiment):
+        import copy
+
+        job = synthetic_experiment.get_job("j1")
+        copied = copy.copy(job)
+        assert copied is not job
+        assert copied.id == job.id
+        assert copied.name == job.name
+        assert copied.params == job.params
+
+
 class TestExperiment:
     """Tests for Experiment edge cases."""
 
@@ -234,3 +332,24 @@ class TestJobCollectionToDataframe:
         df = empty.to_dataframe()
         assert isinstance(df, pd.DataFrame)
         assert df.empty
+
+    def test_nested_params_match_json_normalize(self):
+        """Test nested params flatten like pd.json_normalize, column order included."""
+        import pandas as pd
+
+        jobs = {
+            "j1": {
+                "name": "stage-a",
+                "params": {"a": 1, "n": {"x": 1, "y": {"z": 2}, "w": 3}, "b": [1]},
+            },
+            "j2": {"name": "stage-b", "params": {"m": {"q": {"r": "s"}}, "a": 2.5}},
+        }
+        exp = experiment_from_jobs(jobs)
+
+        rows = [
+            {"job_id": job_id, "name": job["name"], **job["params"]}
+            for job_id, job in jobs.items()
+        ]
+        expected = pd.json_normalize(rows).set_index("job_id")
+
+        pd.testing.assert_frame_equal(exp.jobs().to_dataframe(), expected)
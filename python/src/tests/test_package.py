@@ -0,0 +1,41 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_is_lazy():
+    """
+    Tests that importing the package does not load models or pandas, and that
+    the lazily resolved __version__ is consistent across access styles.
+    """
+    output = run_python(
+        "import sys\n"
+        "import repx_py\n"
+        "assert 'pandas' not in sys.modules, 'pandas imported eagerly'\n"
+        "assert 'repx_py.models' not in sys.modules, 'models imported eagerly'\n"
+        "assert repx_py.models.Experiment is repx_py.Experiment\n"
+        "from repx_py import JobView\n"
+        "assert JobView.__module__ == 'repx_py.models'\n"
+        "assert 'pandas' not in sys.modules, 'pandas imported by models'\n"
+        "public = {n for n in dir(repx_py) if not n.startswith('_')}\n"
+        "assert {'Experiment', 'models'} <= public\n"
+        "assert not public & {'Any', 'TYPE_CHECKING', 'importlib'}, public\n"
+        "assert '__version__' in dir(repx_py)\n"
+        "from repx_py import __version__\n"
+        "assert isinstance(__version__, str) and __version__\n"
+        "assert repx_py.__version__ == __version__\n"
+        "assert 'pandas' not in sys.modules, 'pandas imported by __version__'\n"
+        "print('ok')\n"
+    )
+    assert output == "ok"